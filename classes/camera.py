@@ -6,6 +6,8 @@ This module contains the Camera class that handles viewport management
 and smooth camera following for the game.
 """
 
+import pygame
+
 class Camera:
     """
     Camera class for handling viewport and scrolling in larger maps.
@@ -26,6 +28,7 @@ class Camera:
         self.target_x = 0.0
         self.target_y = 0.0
         self.follow_speed = 5.0  # Camera follow smoothness
+        self._view_rect = pygame.Rect(0, 0, width, height)  # Target viewport
     
     def follow_target(self, target_x, target_y, map_width, map_height, dt):
         """
@@ -39,25 +42,40 @@ class Camera:
             dt (float): Delta time in seconds
         """
         # Center camera on target
-        self.target_x = target_x - self.width // 2
-        self.target_y = target_y - self.height // 2
+        self._view_rect.center = (int(target_x), int(target_y))
         
-        # Clamp camera to map bounds (handle small maps that are smaller than viewport)
-        if map_width <= self.width:
-            # Center small maps horizontally
-            self.target_x = -(self.width - map_width) // 2
-        else:
-            self.target_x = max(0, min(self.target_x, map_width - self.width))
-            
-        if map_height <= self.height:
-            # Center small maps vertically
-            self.target_y = -(self.height - map_height) // 2
-        else:
-            self.target_y = max(0, min(self.target_y, map_height - self.height))
+        # Clamp camera to map bounds; clamp_ip centers maps smaller than the viewport
+        self._view_rect.clamp_ip((0, 0, map_width, map_height))
+        self.target_x, self.target_y = self._view_rect.topleft
         
-        # Smooth camera movement
+        # Smooth camera movement; the approach never lands exactly on the
+        # target, so snap once it is within half a pixel and let it come to rest
         self.x += (self.target_x - self.x) * self.follow_speed * dt
         self.y += (self.target_y - self.y) * self.follow_speed * dt
+        if abs(self.target_x - self.x) < 0.5 and abs(self.target_y - self.y) < 0.5:
+            self.x = float(self.target_x)
+            self.y = float(self.target_y)
+    
+    def is_settled(self):
+        """
+        Check whether the camera has come to rest on its target.
+        
+        Returns:
+            bool: True if the camera sits on its target position
+        """
+        return int(self.x) == self.target_x and int(self.y) == self.target_y
+    
+    def get_offset(self):
+        """
+        Get the whole-pixel offset from world to screen coordinates.
+        
+        Every layer drawn in a frame should use this offset, so they all
+        round the fractional camera position the same way.
+        
+        Returns:
+            tuple: (offset_x, offset_y) to add to world coordinates
+        """
+        return (-int(self.x), -int(self.y))
     
     def world_to_screen(self, world_x, world_y):
         """
@@ -1,6 +1,10 @@
 import pygame
-import sys
 import os
+import random
+import time
+from collections import deque
+from pygame import QUIT, KEYDOWN, NOEVENT, K_ESCAPE, K_f
+from pygame import K_LEFT, K_RIGHT, K_UP, K_DOWN, K_a, K_d, K_w, K_s
 from .tiles import TileType, TILE_SIZE
 from .map import Map
 from .player import Player
@@ -11,6 +15,14 @@ from .items import ItemType, Item, Inventory
 WIDTH = 1000
 HEIGHT = 800
 FPS = 60
+LOGIC_STEP = 1.0 / FPS  # Fixed timestep for game logic in seconds
+FRAME_NS = 1_000_000_000 // FPS  # Frame period for the software pacer
+SPIN_NS = 2_000_000  # Final stretch of each frame that is busy-waited
+MAX_FRAME_TIME = 0.25  # Clamp long frames so the logic can't spiral
+IDLE_WAIT_MS = 100  # Longest time to block waiting for input while idle
+MOVEMENT_KEYS = (K_LEFT, K_RIGHT, K_UP, K_DOWN, K_a, K_d, K_w, K_s)
+TEXT_CACHE_SIZE = 64  # Rendered UI strings kept before the cache is reset
+MAX_EVENTS_PER_FRAME = 32  # Event budget per frame; the rest wait a frame
 PLAYER_SIZE = 40
 
 # Colors
@@ -22,19 +34,58 @@ DARKNESS_ALPHA = 200  # Darkness overlay transparency (0-255)
 VISIBILITY_RADIUS = 1  # Base visibility radius around player
 FLASHLIGHT_RADIUS = 130  # Extended radius when flashlight is on
 
+# Tile names shown in the UI
+TILE_NAMES = {
+    TileType.EMPTY: "Empty",
+    TileType.GRASS: "Grass",
+    TileType.WATER: "Water",
+    TileType.WALL: "Wall",
+    TileType.TREE: "Tree"
+}
+
+# Building door tile types and the interior map each one leads to
+DOOR_DESTINATIONS = {
+    TileType.LIBRARY_DOOR: "library",
+    TileType.CAFETERIA_DOOR: "cafeteria",
+    TileType.DORMITORY_DOOR: "dormitory",
+    TileType.PARKING_DOOR: "parking_map",
+}
+
 class Game:
     """
     Main game class that manages the game state and loop with tile-based map system.
     """
     
+    # Fixed attribute layout: smaller instances and faster attribute access
+    __slots__ = (
+        'screen', 'vsync', 'clock', 'darkness_overlay', 'game_map', 'camera', 'player',
+        'running', '_pending_events', '_keys', '_dirty', '_last_camera_pos', '_last_animation_frame',
+        '_presented_view', '_prev_dirty_rects', '_ui_rects', '_next_frame_ns',
+        'flashlight_enabled', 'flashlight_radius', 'flashlight_intensity',
+        'inventory', 'items', 'current_map_type', 'campus_map', 'interior_maps',
+        'last_building_entered', 'bg_color', 'font', 'item_font', '_text_cache',
+        '_text_block_cache', '_ui_lines_cache', 'controls_surface',
+    )
+    
     def __init__(self):
         """
         Initialize the game with screen, clock, map, and player.
         """
-        # Set up the display
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # Set up the display, preferring a SCALED window: it presents through an
+        # SDL renderer, the only non-OpenGL mode where pygame applies vsync.
+        # Without a renderer pygame may only warn and hand back a plain window,
+        # so trust vsync only if the surface really is SCALED.
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.vsync = bool(self.screen.get_flags() & pygame.SCALED)
         pygame.display.set_caption("Campus Lockdown - Dark Campus Edition")
         
+        # Only queue the events the game reacts to; SDL drops the rest
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYDOWN, pygame.WINDOWEXPOSED])
+        
         # Set up the game clock for consistent FPS
         self.clock = pygame.time.Clock()
         
@@ -68,6 +119,22 @@ class Game:
         # Game state
         self.running = True
         
+        # Events left over from frames that hit the event budget
+        self._pending_events = deque()
+        
+        # Held key state, sampled once per frame in handle_events
+        self._keys = pygame.key.get_pressed()
+        
+        # Redraw tracking: only render frames whose contents changed
+        self._dirty = True
+        self._last_camera_pos = None
+        self._last_animation_frame = None
+        
+        # Dirty-rect presentation: screen regions changed since the last frame
+        self._presented_view = None
+        self._prev_dirty_rects = []
+        self._ui_rects = []
+        
         # Flashlight state
         self.flashlight_enabled = False
         self.flashlight_radius = FLASHLIGHT_RADIUS
@@ -88,6 +155,15 @@ class Game:
         
         # Background color for better contrast
         self.bg_color = (20, 30, 40)  # Dark blue-gray background
+        
+        # UI fonts and rendered text, reused across frames
+        self.font = pygame.font.Font(None, 24)
+        self.item_font = pygame.font.Font(None, 20)
+        self._text_cache = {}
+        self._text_block_cache = None
+        self._ui_lines_cache = None  # (state, lines) behind the last stats block
+        self.controls_surface = self._render_text(
+            "Use WASD or Arrow Keys to explore | Press F to toggle flashlight", WHITE)
     
     def _create_sample_map(self):
         """
@@ -128,15 +204,12 @@ class Game:
         for y in range(self.game_map.height // 2 - 2, self.game_map.height // 2 + 3):
             for x in range(self.game_map.width // 2 - 2, self.game_map.width // 2 + 3):
                 if self.game_map.is_walkable(x, y):
-                    pixel_x, pixel_y = self.game_map.grid_to_pixel(x, y)
-                    return pixel_x, pixel_y
+                    return x * TILE_SIZE, y * TILE_SIZE
         
         # Fallback: find any walkable tile
-        for y in range(self.game_map.height):
-            for x in range(self.game_map.width):
-                if self.game_map.is_walkable(x, y):
-                    pixel_x, pixel_y = self.game_map.grid_to_pixel(x, y)
-                    return pixel_x, pixel_y
+        first_walkable = self.game_map.find_first_walkable()
+        if first_walkable:
+            return first_walkable[0] * TILE_SIZE, first_walkable[1] * TILE_SIZE
         
         # Last resort: center of screen
         return (WIDTH - PLAYER_SIZE) // 2, (HEIGHT - PLAYER_SIZE) // 2
@@ -145,8 +218,6 @@ class Game:
         """
         Spawn items randomly across walkable tiles on the map.
         """
-        import random
-        
         # Number of items to spawn
         num_potions = random.randint(8, 12)
         num_scrolls = random.randint(5, 8)
@@ -158,17 +229,13 @@ class Game:
             (ItemType.KEY, num_keys)
         ]
         
-        # Get all walkable positions
-        walkable_positions = []
-        for y in range(self.game_map.height):
-            for x in range(self.game_map.width):
-                if self.game_map.is_walkable(x, y):
-                    # Don't spawn items too close to player spawn point
-                    spawn_x = self.game_map.spawn_point.get('x', 0)
-                    spawn_y = self.game_map.spawn_point.get('y', 0)
-                    distance = ((x - spawn_x) ** 2 + (y - spawn_y) ** 2) ** 0.5
-                    if distance > 3:  # Minimum distance from spawn
-                        walkable_positions.append((x, y))
+        # Get all walkable positions, except those too close to the player spawn point
+        spawn_x = self.game_map.spawn_point.get('x', 0)
+        spawn_y = self.game_map.spawn_point.get('y', 0)
+        walkable_positions = [
+            (x, y) for x, y in self.game_map.get_walkable_positions()
+            if (x - spawn_x) ** 2 + (y - spawn_y) ** 2 > 9  # Minimum distance of 3 from spawn
+        ]
         
         # Spawn items randomly
         for item_type, count in items_to_spawn:
@@ -201,23 +268,15 @@ class Game:
         Check if the player is on a door tile and handle map transitions.
         """
         player_grid_x, player_grid_y = self.player.get_grid_position()
-        current_tile = self.game_map.get_tile(player_grid_x, player_grid_y)
-        
-        if current_tile:
-            tile_type = current_tile.tile_type
-            
-            # Check for building-specific doors
-            if tile_type == TileType.LIBRARY_DOOR:
-                self._transition_to_interior("library")
-            elif tile_type == TileType.CAFETERIA_DOOR:
-                self._transition_to_interior("cafeteria")
-            elif tile_type == TileType.DORMITORY_DOOR:
-                self._transition_to_interior("dormitory")
-            elif tile_type == TileType.PARKING_DOOR:
-                self._transition_to_interior("parking_map")
-            elif tile_type == TileType.DOOR and self.current_map_type != "campus":
-                # Generic door in interior maps - return to campus
-                self._transition_to_campus()
+        tile_type = self.game_map.get_tile_type(player_grid_x, player_grid_y)
+        
+        # Check for building-specific doors with a single lookup
+        building_type = DOOR_DESTINATIONS.get(tile_type)
+        if building_type is not None:
+            self._transition_to_interior(building_type)
+        elif tile_type == TileType.DOOR and self.current_map_type != "campus":
+            # Generic door in interior maps - return to campus
+            self._transition_to_campus()
     
     def _transition_to_interior(self, building_type):
         """
@@ -249,12 +308,7 @@ class Game:
             # Position player at entrance (near a door)
             entrance_pos = self._find_entrance_position()
             if entrance_pos:
-                self.player.x, self.player.y = self.game_map.grid_to_pixel(entrance_pos[0], entrance_pos[1])
-                # Update player's grid position to match new pixel position
-                self.player.grid_x = entrance_pos[0]
-                self.player.grid_y = entrance_pos[1]
-                self.player.target_grid_x = entrance_pos[0]
-                self.player.target_grid_y = entrance_pos[1]
+                self.player.set_grid_position(entrance_pos[0], entrance_pos[1])
             
             print(f"Entered {building_type}")
     
@@ -270,12 +324,7 @@ class Game:
             # Position player outside the building they just exited
             exit_pos = self._find_campus_exit_position()
             if exit_pos:
-                self.player.x, self.player.y = self.game_map.grid_to_pixel(exit_pos[0], exit_pos[1])
-                # Update player's grid position to match new pixel position
-                self.player.grid_x = exit_pos[0]
-                self.player.grid_y = exit_pos[1]
-                self.player.target_grid_x = exit_pos[0]
-                self.player.target_grid_y = exit_pos[1]
+                self.player.set_grid_position(exit_pos[0], exit_pos[1])
             
             print("Returned to campus")
     
@@ -295,8 +344,7 @@ class Game:
         # Fallback: Find position near a door
         for y in range(self.game_map.height):
             for x in range(self.game_map.width):
-                tile = self.game_map.get_tile(x, y)
-                if tile and tile.tile_type == TileType.DOOR:
+                if self.game_map.get_tile_type(x, y) == TileType.DOOR:
                     # Find adjacent walkable tile
                     for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                         adj_x, adj_y = x + dx, y + dy
@@ -345,42 +393,68 @@ class Game:
         """
         Handle pygame events like window close and key presses.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Pump SDL once, then take the whole (pre-filtered) queue as one batch
+        pygame.event.pump()
+        pending = self._pending_events
+        pending.extend(pygame.event.get(pump=False))
+        
+        # Handle at most a fixed budget so an event flood can't stall a frame
+        for _ in range(min(len(pending), MAX_EVENTS_PER_FRAME)):
+            self._handle_event(pending.popleft())
+        
+        # Sample held keys right after pumping so input is as fresh as possible
+        self._keys = pygame.key.get_pressed()
+    
+    def _handle_event(self, event):
+        """
+        Handle a single pygame event.
+        
+        Args:
+            event (pygame.event.Event): The event to handle
+        """
+        # Any event (key press, window expose, ...) may change the screen
+        self._dirty = True
+        if event.type == QUIT:
+            self.running = False
+        elif event.type == KEYDOWN:
+            if event.key == K_ESCAPE:
                 self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_f:
-                    # Toggle flashlight on/off
-                    self.flashlight_enabled = not self.flashlight_enabled
-                    print(f"Flashlight {'ON' if self.flashlight_enabled else 'OFF'}")
+            elif event.key == K_f:
+                # Toggle flashlight on/off
+                self.flashlight_enabled = not self.flashlight_enabled
+                print(f"Flashlight {'ON' if self.flashlight_enabled else 'OFF'}")
     
     def handle_input(self):
         """
         Handle continuous key input for smooth tile-based player movement.
         """
-        keys = pygame.key.get_pressed()
+        keys = self._keys
         
         # Handle movement with arrow keys or WASD
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if keys[K_LEFT] or keys[K_a]:
             self.player.move(-1, 0)
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        elif keys[K_RIGHT] or keys[K_d]:
             self.player.move(1, 0)
-        elif keys[pygame.K_UP] or keys[pygame.K_w]:
+        elif keys[K_UP] or keys[K_w]:
             self.player.move(0, -1)
-        elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        elif keys[K_DOWN] or keys[K_s]:
             self.player.move(0, 1)
     
-    def update(self):
+    def update(self, dt=LOGIC_STEP):
         """
         Update game state, player animation, and camera.
+        
+        Args:
+            dt (float): Delta time in seconds
         """
-        # Calculate delta time in seconds
-        dt = self.clock.get_time() / 1000.0
+        # Start a new move before animating so it shows up this frame
+        if not self.player.is_moving:
+            self.handle_input()
         
-        # Update player animation
-        self.player.update(dt)
+        # Update player animation (nothing to do while standing still)
+        player = self.player
+        if player.is_moving:
+            player.update(dt)
         
         # Update camera to follow player
         map_width = self.game_map.width * TILE_SIZE
@@ -399,14 +473,73 @@ class Game:
         # Check for door transitions
         self._check_door_transition()
         
+        # Chain into the next move as soon as the current one finishes
         self.handle_input()
+        
+        if self._has_visible_changes():
+            self._dirty = True
+    
+    def _has_visible_changes(self):
+        """
+        Check whether the last update changed anything on screen.
+        
+        Returns:
+            bool: True if the next frame would differ from the last one drawn
+        """
+        if self.player.is_moving:
+            return True
+        
+        camera_pos = (int(self.camera.x), int(self.camera.y))
+        animation_frame = self.game_map.get_animation_frame()
+        if (camera_pos != self._last_camera_pos or
+                animation_frame != self._last_animation_frame):
+            self._last_camera_pos = camera_pos
+            self._last_animation_frame = animation_frame
+            return True
+        
+        # Uncollected items bob continuously while on screen
+        view_rect = pygame.Rect(camera_pos[0], camera_pos[1], WIDTH, HEIGHT)
+        for item in self.items:
+            if not item.collected and view_rect.colliderect(item.get_rect()):
+                return True
+        
+        return False
+    
+    def _is_idle(self):
+        """
+        Check whether the game state is at rest, so the loop can block for input.
+        
+        Returns:
+            bool: True if nothing is moving, animating, waiting on a held key
+                or waiting to be drawn, and the camera has settled
+        """
+        if self._dirty or self.player.is_moving:
+            return False
+        
+        # The camera keeps easing towards the player after a move stops
+        if not self.camera.is_settled():
+            return False
+        
+        # A held movement key starts a move on the next logic step
+        keys = self._keys
+        if any(keys[key] for key in MOVEMENT_KEYS):
+            return False
+        
+        if self._has_visible_changes():
+            # The change has now been recorded, so make sure it gets drawn
+            self._dirty = True
+            return False
+        
+        return True
     
     def draw(self):
         """
         Draw all game objects to the screen with camera system and dark environment effect.
         """
-        # Fill the screen with background color
-        self.screen.fill(self.bg_color)
+        # Fill the screen with background color where the map won't cover it
+        map_rect = self.game_map.background.get_rect().move(self.camera.get_offset())
+        if not map_rect.contains(self.screen.get_rect()):
+            self.screen.fill(self.bg_color)
         
         # Draw the map tiles with camera
         self.game_map.draw(self.screen, self.camera)
@@ -424,10 +557,118 @@ class Game:
             self.screen.blit(self.darkness_overlay, (0, 0))
         
         # Draw UI elements on top of darkness
+        self._ui_rects = []
         self._draw_ui()
         
-        # Update the display
-        pygame.display.flip()
+        # Update the display, only presenting changed regions when possible
+        dirty_rects = self._get_dirty_rects()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+    
+    def _get_dirty_rects(self):
+        """
+        Collect the screen regions that changed since the last presented frame.
+        
+        Returns:
+            list: Rects to update, or None if the whole screen must be updated
+        """
+        current_radius = FLASHLIGHT_RADIUS if self.flashlight_enabled else VISIBILITY_RADIUS
+        
+        # Player, light circle and items all move on screen
+        offset_x, offset_y = self.camera.get_offset()
+        player_rect = self.player.rect.move(offset_x, offset_y)
+        light_rect = pygame.Rect(0, 0, current_radius * 2 + 1, current_radius * 2 + 1)
+        light_rect.center = (int(self.player.x + offset_x + TILE_SIZE // 2),
+                             int(self.player.y + offset_y + TILE_SIZE // 2))
+        rects = [player_rect.union(light_rect)]
+        view_rect = self.screen.get_rect()
+        for item in self.items:
+            if not item.collected:
+                # Include the glow and bobbing range around the item
+                item_rect = item.get_rect().move(offset_x, offset_y).inflate(18, 18)
+                if view_rect.colliderect(item_rect):
+                    rects.append(item_rect)
+        rects.extend(self._ui_rects)
+        
+        # Anything that shifts or restyles the whole view needs a full update
+        view = (int(self.camera.x), int(self.camera.y), self.game_map,
+                self.game_map.get_animation_frame(), current_radius)
+        full_update = view != self._presented_view
+        self._presented_view = view
+        
+        dirty_rects = None if full_update else rects + self._prev_dirty_rects
+        self._prev_dirty_rects = rects
+        return dirty_rects
+    
+    def _render_text(self, text, color, font=None):
+        """
+        Render a UI string, reusing the surface from earlier frames if possible.
+        
+        Args:
+            text (str): The text to render
+            color (tuple): RGB text color
+            font (pygame.font.Font): Font to use, defaults to the main UI font
+            
+        Returns:
+            pygame.Surface: The rendered text surface
+        """
+        font = font or self.font
+        key = (text, color, font)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def _render_text_block(self, lines, line_height=25):
+        """
+        Render stacked UI lines into a single surface, reusing the last block
+        if none of the lines changed.
+        
+        Args:
+            lines (tuple): (text, color) pairs, or None to leave a line blank
+            line_height (int): Vertical distance between lines in pixels
+            
+        Returns:
+            pygame.Surface: The rendered text block
+        """
+        if self._text_block_cache and self._text_block_cache[0] == lines:
+            return self._text_block_cache[1]
+        
+        line_surfaces = [line and self._render_text(*line) for line in lines]
+        width = max(surface.get_width() for surface in line_surfaces if surface)
+        height = line_height * (len(lines) - 1) + self.font.get_linesize()
+        block = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, surface in enumerate(line_surfaces):
+            if surface:
+                block.blit(surface, (0, i * line_height), special_flags=pygame.BLEND_RGBA_MAX)
+        
+        block = block.convert_alpha()
+        self._text_block_cache = (lines, block)
+        return block
+    
+    def _blit_ui(self, surface, position):
+        """
+        Blit a UI surface to the screen and record the area it covers.
+        
+        Args:
+            surface (pygame.Surface): The UI surface to draw
+            position (tuple): Screen position of the surface
+        """
+        self._ui_rects.append(self.screen.blit(surface, position))
+    
+    def _blits_ui(self, blit_sequence):
+        """
+        Blit several UI surfaces in one call and record the areas they cover.
+        
+        Args:
+            blit_sequence (list): (surface, position) pairs to draw in order
+        """
+        self._ui_rects.extend(self.screen.blits(blit_sequence))
     
     def _create_flashlight_effect(self):
         """
@@ -435,8 +676,9 @@ class Game:
         Uses different radius based on flashlight state.
         """
         # Calculate player's screen position
-        player_screen_x = self.player.x - self.camera.x + TILE_SIZE // 2
-        player_screen_y = self.player.y - self.camera.y + TILE_SIZE // 2
+        offset_x, offset_y = self.camera.get_offset()
+        player_screen_x = self.player.x + offset_x + TILE_SIZE // 2
+        player_screen_y = self.player.y + offset_y + TILE_SIZE // 2
         
         # Create a new darkness overlay surface with per-pixel alpha
         self.darkness_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -469,56 +711,67 @@ class Game:
         """
         Draw UI elements like position indicator, camera info, and controls.
         """
-        font = pygame.font.Font(None, 24)
+        # The stats lines only depend on these values, so the strings are
+        # formatted again only when one of them changes
+        grid_pos = self.player.get_grid_position()
+        current_tile_type = self.game_map.get_tile_type(grid_pos[0], grid_pos[1])
+        ui_state = (int(self.player.x), int(self.player.y), grid_pos,
+                    int(self.camera.x), int(self.camera.y), self.game_map,
+                    current_tile_type, self.flashlight_enabled)
+        if self._ui_lines_cache and self._ui_lines_cache[0] == ui_state:
+            lines = self._ui_lines_cache[1]
+        else:
+            lines = self._format_ui_lines(grid_pos, current_tile_type)
+            self._ui_lines_cache = (ui_state, lines)
+        
+        # Stats block and controls reminder go out in one blits() call
+        self._blits_ui((
+            (self._render_text_block(lines), (10, 10)),
+            (self.controls_surface, (10, HEIGHT - 30)),
+        ))
         
+        # Draw inventory UI panel
+        self._draw_inventory_ui()
+    
+    def _format_ui_lines(self, grid_pos, current_tile_type):
+        """
+        Format the stats lines shown in the top-left corner.
+        
+        Args:
+            grid_pos (tuple): Player (grid_x, grid_y) position
+            current_tile_type (int): Tile type under the player, or None
+            
+        Returns:
+            tuple: (text, color) pairs, or None for a blank line
+        """
         # Player position indicator (both pixel and grid coordinates)
         pixel_pos = f"Player: ({int(self.player.x)}, {int(self.player.y)})"
-        grid_pos = self.player.get_grid_position()
         grid_text = f"Grid: ({grid_pos[0]}, {grid_pos[1]})"
         
-        pixel_surface = font.render(pixel_pos, True, WHITE)
-        grid_surface = font.render(grid_text, True, WHITE)
-        
-        self.screen.blit(pixel_surface, (10, 10))
-        self.screen.blit(grid_surface, (10, 35))
-        
         # Camera position indicator
         camera_text = f"Camera: ({int(self.camera.x)}, {int(self.camera.y)})"
-        camera_surface = font.render(camera_text, True, WHITE)
-        self.screen.blit(camera_surface, (10, 60))
         
         # Map information
         map_info = f"Map: {self.game_map.name} ({self.game_map.width}x{self.game_map.height})"
-        map_surface = font.render(map_info, True, WHITE)
-        self.screen.blit(map_surface, (10, 85))
         
         # Current tile type indicator
-        current_tile = self.game_map.get_tile(grid_pos[0], grid_pos[1])
-        if current_tile:
-            tile_name = {
-                TileType.EMPTY: "Empty",
-                TileType.GRASS: "Grass", 
-                TileType.WATER: "Water",
-                TileType.WALL: "Wall",
-                TileType.TREE: "Tree"
-            }.get(current_tile.tile_type, "Unknown")
-            tile_text = f"Current Tile: {tile_name}"
-            tile_surface = font.render(tile_text, True, YELLOW)
-            self.screen.blit(tile_surface, (10, 110))
+        tile_line = None
+        if current_tile_type is not None:
+            tile_name = TILE_NAMES.get(current_tile_type, "Unknown")
+            tile_line = (f"Current Tile: {tile_name}", YELLOW)
         
         # Flashlight status indicator
         flashlight_status = f"Flashlight: {'ON' if self.flashlight_enabled else 'OFF'} (Press F to toggle)"
         flashlight_color = YELLOW if self.flashlight_enabled else WHITE
-        flashlight_surface = font.render(flashlight_status, True, flashlight_color)
-        self.screen.blit(flashlight_surface, (10, 135))
         
-        # Controls reminder
-        controls_text = "Use WASD or Arrow Keys to explore | Press F to toggle flashlight"
-        controls_surface = font.render(controls_text, True, WHITE)
-        self.screen.blit(controls_surface, (10, HEIGHT - 30))
-        
-        # Draw inventory UI panel
-        self._draw_inventory_ui()
+        return (
+            (pixel_pos, WHITE),
+            (grid_text, WHITE),
+            (camera_text, WHITE),
+            (map_info, WHITE),
+            tile_line,
+            (flashlight_status, flashlight_color),
+        )
     
     def _draw_inventory_ui(self):
         """
@@ -534,20 +787,21 @@ class Game:
         panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         panel_surface.fill((0, 0, 0, 180))  # Semi-transparent black
         pygame.draw.rect(panel_surface, WHITE, (0, 0, panel_width, panel_height), 2)
-        self.screen.blit(panel_surface, (panel_x, panel_y))
+        self._blit_ui(panel_surface, (panel_x, panel_y))
+        
+        # Text never overlaps the icons, so it is collected and blitted in one call
+        text_blits = []
         
         # Draw inventory title
-        font = pygame.font.Font(None, 24)
-        title_surface = font.render("Inventory", True, WHITE)
-        self.screen.blit(title_surface, (panel_x + 10, panel_y + 10))
+        title_surface = self._render_text("Inventory", WHITE)
+        text_blits.append((title_surface, (panel_x + 10, panel_y + 10)))
         
         # Draw inventory stats
         stats_text = f"{self.inventory.get_total_items()}/{self.inventory.max_slots} items"
-        stats_surface = font.render(stats_text, True, YELLOW)
-        self.screen.blit(stats_surface, (panel_x + panel_width - 80, panel_y + 10))
+        stats_surface = self._render_text(stats_text, YELLOW)
+        text_blits.append((stats_surface, (panel_x + panel_width - 80, panel_y + 10)))
         
         # Draw item counts with icons
-        item_font = pygame.font.Font(None, 20)
         y_offset = 40
         
         for item_type in [ItemType.POTION, ItemType.SCROLL, ItemType.KEY]:
@@ -595,18 +849,40 @@ class Game:
             # Draw item count and name
             count_text = f"{count}x {name}"
             text_color = WHITE if count > 0 else (128, 128, 128)
-            count_surface = item_font.render(count_text, True, text_color)
-            self.screen.blit(count_surface, (icon_x + icon_size + 10, icon_y + 2))
+            count_surface = self._render_text(count_text, text_color, self.item_font)
+            text_blits.append((count_surface, (icon_x + icon_size + 10, icon_y + 2)))
             
             y_offset += 25
         
         # Draw inventory instructions
         if self.inventory.get_total_items() == 0:
             instruction_text = "Walk over items to collect them"
-            instruction_surface = item_font.render(instruction_text, True, (128, 128, 128))
+            instruction_surface = self._render_text(instruction_text, (128, 128, 128), self.item_font)
             text_rect = instruction_surface.get_rect()
             text_x = panel_x + (panel_width - text_rect.width) // 2
-            self.screen.blit(instruction_surface, (text_x, panel_y + panel_height - 30))
+            text_blits.append((instruction_surface, (text_x, panel_y + panel_height - 30)))
+        
+        self._blits_ui(text_blits)
+    
+    def _wait_for_next_frame(self):
+        """
+        Wait until the next frame is due using the monotonic clock.
+        
+        Sleeps for most of the remaining time and busy-waits only the last
+        SPIN_NS, so the frame period isn't stretched by coarse OS sleeps.
+        """
+        self._next_frame_ns += FRAME_NS
+        now = time.monotonic_ns()
+        if now >= self._next_frame_ns:
+            # Running behind (or just woke up from idle): resync to now
+            self._next_frame_ns = now
+            return
+        
+        remaining = self._next_frame_ns - now
+        if remaining > SPIN_NS:
+            pygame.time.wait((remaining - SPIN_NS) // 1_000_000)
+        while time.monotonic_ns() < self._next_frame_ns:
+            pass
     
     def run(self):
         """
@@ -619,19 +895,50 @@ class Game:
         print("  ESC or Close Window: Quit game")
         print(f"Map loaded: {self.game_map.name} ({self.game_map.width}x{self.game_map.height} tiles)")
         
+        accumulator = 0.0
+        self._next_frame_ns = time.monotonic_ns()
+        
+        # Bind per-frame callables to locals once, outside the hot loop
+        tick = self.clock.tick
+        wait_event = pygame.event.wait
+        handle_event = self._handle_event
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        wait_for_next_frame = self._wait_for_next_frame
+        is_idle = self._is_idle
+        vsync = self.vsync
+        
         while self.running:
-            # Handle events
-            self.handle_events()
+            # Wait for the next frame: with vsync flip() blocks and tick(FPS)
+            # still caps the rate in case the driver ignores the request,
+            # otherwise sleep and spin only the tail to avoid SDL's coarse
+            # sleep. While idle, block in the OS until input arrives.
+            if is_idle():
+                event = wait_event(IDLE_WAIT_MS)
+                if event.type != NOEVENT:
+                    handle_event(event)
+                # Time spent waiting is not game time: restart the frame clock
+                # so the next steps don't jump ahead
+                tick()
+                accumulator = 0.0
+                frame_time = 0.0
+            elif vsync:
+                frame_time = tick(FPS) / 1000.0
+            else:
+                wait_for_next_frame()
+                frame_time = tick() / 1000.0
+            accumulator += min(frame_time, MAX_FRAME_TIME)
             
-            # Update game state
-            self.update()
+            # Handle events
+            handle_events()
             
-            # Draw everything
-            self.draw()
+            # Update game state in fixed steps, independent of render rate
+            while accumulator >= LOGIC_STEP:
+                update(LOGIC_STEP)
+                accumulator -= LOGIC_STEP
             
-            # Maintain consistent frame rate
-            self.clock.tick(FPS)
-        
-        # Clean up
-        pygame.quit()
-        sys.exit()
\ No newline at end of file
+            # Draw everything, skipping frames where nothing changed
+            if self._dirty:
+                draw()
+                self._dirty = False
\ No newline at end of file
@@ -1,3 +1,5 @@
+import math
+import types
 import pygame
 from .tiles import TILE_SIZE
 
@@ -75,7 +77,6 @@ class Item:
             self.bob_offset += self.bob_speed * dt
             
             # Glow animation
-            import math
             self.glow_alpha = int(128 + 64 * math.sin(self.bob_offset * 2))
     
     def _create_item_surface(self):
@@ -196,6 +197,9 @@ class Item:
             # Magical glow around key
             pygame.draw.circle(surface, (255, 215, 0, 50), (center, center), 12)
         
+        # Match the display's pixel format so blits don't convert every frame
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
         return surface
     
     def draw(self, screen, camera):
@@ -209,11 +213,10 @@ class Item:
         if self.collected:
             return
         
-        import math
-        
         # Calculate screen position with camera offset
-        screen_x = self.pixel_x - camera.x
-        screen_y = self.pixel_y - camera.y + math.sin(self.bob_offset) * 3
+        offset_x, offset_y = camera.get_offset()
+        screen_x = self.pixel_x + offset_x
+        screen_y = self.pixel_y + offset_y + math.sin(self.bob_offset) * 3
         
         # Only draw if visible on screen
         if (-self.size <= screen_x <= screen.get_width() + self.size and
@@ -227,8 +230,9 @@ class Item:
             screen.blit(glow_surface, (screen_x - 5, screen_y - 5))
             
             # Draw detailed item surface
-            item_surface = self._create_item_surface()
-            screen.blit(item_surface, (int(screen_x), int(screen_y)))
+            if self._surface_cache is None:
+                self._surface_cache = self._create_item_surface()
+            screen.blit(self._surface_cache, (int(screen_x), int(screen_y)))
     
     def collect(self):
         """
@@ -264,6 +268,9 @@ class Inventory:
         # Initialize item counts
         for item_type in [ItemType.POTION, ItemType.SCROLL, ItemType.KEY]:
             self.item_counts[item_type] = 0
+        
+        # Read-only view handed out by get_summary() instead of a fresh copy
+        self._summary_view = types.MappingProxyType(self.item_counts)
     
     def add_item(self, item):
         """
@@ -362,6 +369,6 @@ class Inventory:
         Get a summary of items in the inventory.
         
         Returns:
-            dict: Dictionary with item types as keys and counts as values
+            mappingproxy: Read-only live view with item types as keys and counts as values
         """
-        return self.item_counts.copy()
\ No newline at end of file
+        return self._summary_view
\ No newline at end of file
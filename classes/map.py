@@ -2,7 +2,112 @@ import json
 import os
 import pygame
 import time
-from .tiles import TileType, Tile, TILE_SIZE
+from itertools import compress
+from .tiles import TileType, Tile, TILE_SIZE, CHAR_TYPE_TABLE, WALKABLE_TABLE
+
+# Pre-rendered tile images keyed by (tile_type, texture variant)
+_tile_images = {}
+
+# Pre-rendered water tile images keyed by animation frame
+_water_frames = {}
+
+def _draw_water_details(surface, tile, screen_x, screen_y, wave_offset):
+    """
+    Draw animated ripples and sparkles on a water tile.
+    
+    Arguments match Map._render_tile.
+    """
+    # Animated water effect with multiple ripples
+    ripple_color = tuple(min(255, c + 20) for c in tile.color)
+    
+    # Draw multiple ripple lines
+    for i in range(0, TILE_SIZE, 8):
+        ripple_y = screen_y + (i + wave_offset) % TILE_SIZE
+        if screen_y <= ripple_y < screen_y + TILE_SIZE:
+            pygame.draw.line(surface, ripple_color, 
+                           (screen_x, ripple_y), 
+                           (screen_x + TILE_SIZE, ripple_y), 1)
+    
+    # Add some sparkle effects
+    sparkle_positions = [(10, 15), (30, 35), (20, 5), (40, 25)]
+    sparkle_color = (200, 230, 255)
+    for sx, sy in sparkle_positions:
+        if (wave_offset + sx + sy) % 40 < 10:
+            pygame.draw.circle(surface, sparkle_color, 
+                             (screen_x + sx, screen_y + sy), 1)
+
+def _draw_tree_details(surface, tile, screen_x, screen_y, wave_offset):
+    """
+    Draw the trunk and leaves of a tree tile.
+    
+    Arguments match Map._render_tile.
+    """
+    # Enhanced tree with trunk and leaves
+    trunk_color = (101, 67, 33)  # Brown trunk
+    leaf_color = tuple(min(255, c + 30) for c in tile.color)
+    
+    # Draw trunk
+    trunk_width = TILE_SIZE // 4
+    trunk_x = screen_x + (TILE_SIZE - trunk_width) // 2
+    trunk_y = screen_y + TILE_SIZE // 2
+    pygame.draw.rect(surface, trunk_color, 
+                   (trunk_x, trunk_y, trunk_width, TILE_SIZE // 2))
+    
+    # Draw leaves (multiple circles for fuller look)
+    leaf_radius = TILE_SIZE // 3
+    pygame.draw.circle(surface, leaf_color, 
+                     (screen_x + TILE_SIZE // 2, screen_y + TILE_SIZE // 3), 
+                     leaf_radius)
+    pygame.draw.circle(surface, tile.color, 
+                     (screen_x + TILE_SIZE // 2 - 5, screen_y + TILE_SIZE // 3 - 5), 
+                     leaf_radius // 2)
+    pygame.draw.circle(surface, leaf_color, 
+                     (screen_x + TILE_SIZE // 2 + 5, screen_y + TILE_SIZE // 3 + 5), 
+                     leaf_radius // 2)
+
+def _draw_wall_details(surface, tile, screen_x, screen_y, wave_offset):
+    """
+    Draw the sparse texture pattern of a wall tile.
+    
+    Arguments match Map._render_tile.
+    """
+    x, y = tile.grid_x, tile.grid_y
+    
+    # Sparse texture pattern for walls
+    for i in range(2):
+        for j in range(2):
+            if (x + y + i + j) % 3 == 0:
+                texture_x = screen_x + i * (TILE_SIZE // 2) + (TILE_SIZE // 4)
+                texture_y = screen_y + j * (TILE_SIZE // 2) + (TILE_SIZE // 4)
+                darker_color = (max(0, tile.color[0] - 20), 
+                              max(0, tile.color[1] - 20), 
+                              max(0, tile.color[2] - 20))
+                pygame.draw.circle(surface, darker_color, (texture_x, texture_y), 2)
+
+def _draw_floor_details(surface, tile, screen_x, screen_y, wave_offset):
+    """
+    Draw the subtle texture dots of a floor tile.
+    
+    Arguments match Map._render_tile.
+    """
+    x, y = tile.grid_x, tile.grid_y
+    
+    # Add subtle texture dots for floor tiles
+    texture_color = (min(255, tile.color[0] + 10), 
+                   min(255, tile.color[1] + 10), 
+                   min(255, tile.color[2] + 10))
+    
+    # Sparse texture pattern
+    if (x + y) % 4 == 0:
+        pygame.draw.circle(surface, texture_color, 
+                         (screen_x + TILE_SIZE // 2, screen_y + TILE_SIZE // 2), 1)
+
+# Detail renderers by tile type; any other type is drawn as floor
+_DETAIL_RENDERERS = {
+    TileType.WATER: _draw_water_details,
+    TileType.TREE: _draw_tree_details,
+    TileType.WALL: _draw_wall_details,
+}
 
 class Map:
     """
@@ -14,7 +119,7 @@ class Map:
         Initialize the map from a 2D array.
         
         Args:
-            map_data (list): 2D list representing the map layout
+            map_data (list): Rows of tile types (lists or bytes) representing the map layout
             name (str): Name of the map
             spawn_point (dict): Dictionary with 'x' and 'y' keys for spawn location
         """
@@ -23,20 +128,25 @@ class Map:
         self.width = len(map_data[0]) if map_data and len(map_data) > 0 else 0
         self.name = name
         self.spawn_point = spawn_point or {'x': 0, 'y': 0}
-        self.tiles = []
         
-        # Create tile objects from map data
+        # Flat row-major tile types; short rows are padded with EMPTY
+        self.grid = bytearray()
         for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                # Ensure we don't go out of bounds
-                if y < len(map_data) and x < len(map_data[y]):
-                    tile_type = map_data[y][x]
-                else:
-                    tile_type = TileType.EMPTY  # Default fallback
-                tile = Tile(tile_type, x, y)
-                row.append(tile)
-            self.tiles.append(row)
+            row = bytes(map_data[y][:self.width])
+            self.grid += row.ljust(self.width, bytes((TileType.EMPTY,)))
+        
+        # Animated tiles per grid row, as lists of grid x coordinates
+        self._water_rows = []
+        for y in range(self.height):
+            row = self.grid[y * self.width:(y + 1) * self.width]
+            self._water_rows.append([x for x, tile_type in enumerate(row) if tile_type == TileType.WATER])
+        self.has_water = TileType.WATER in self.grid
+        
+        # The map is static, so render it once and blit it every frame
+        self.background = pygame.Surface((self.width * TILE_SIZE, self.height * TILE_SIZE))
+        if pygame.display.get_surface() is not None:
+            self.background = self.background.convert()
+        self.invalidate(self.background.get_rect())
     
     @classmethod
     def from_json(cls, json_file_path):
@@ -69,16 +179,16 @@ class Map:
             if not map_strings:
                 raise ValueError("No map_data found in JSON file")
             
-            # Convert character-based map to tile type array
+            # Convert character-based map to tile type rows with one table lookup
+            # per row; rows with non-ASCII characters go through from_char()
             map_data = []
             for i, row_string in enumerate(map_strings):
                 if not isinstance(row_string, str):
                     raise ValueError(f"Row {i} is not a string: {type(row_string)}")
-                row = []
-                for char in row_string:
-                    tile_type = TileType.from_char(char)
-                    row.append(tile_type)
-                map_data.append(row)
+                if row_string.isascii():
+                    map_data.append(row_string.encode('ascii').translate(CHAR_TYPE_TABLE))
+                else:
+                    map_data.append(bytes(TileType.from_char(char) for char in row_string))
             
             # Debug: Verify map_data before creating Map
             if not map_data:
@@ -100,10 +210,25 @@ class Map:
             y (int): Grid y coordinate
             
         Returns:
-            Tile: The tile at the specified position, or None if out of bounds
+            Tile: A new tile for the specified position, or None if out of bounds
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            return Tile(self.grid[y * self.width + x], x, y)
+        return None
+    
+    def get_tile_type(self, x, y):
+        """
+        Get the tile type at the specified grid coordinates.
+        
+        Args:
+            x (int): Grid x coordinate
+            y (int): Grid y coordinate
+            
+        Returns:
+            int: The tile type at the specified position, or None if out of bounds
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.grid[y * self.width + x]
         return None
     
     def is_walkable(self, x, y):
@@ -117,21 +242,46 @@ class Map:
         Returns:
             bool: True if the tile is walkable, False otherwise
         """
-        tile = self.get_tile(x, y)
-        return tile is not None and tile.walkable
+        return (0 <= x < self.width and 0 <= y < self.height and
+                WALKABLE_TABLE[self.grid[y * self.width + x]] == 1)
+    
+    def find_first_walkable(self):
+        """
+        Find the first walkable tile in row-major order.
+        
+        Returns:
+            tuple: (grid_x, grid_y) coordinates, or None if nothing is walkable
+        """
+        # First 1 in the per-tile walkable flags, found in one C-level pass
+        index = self.grid.translate(WALKABLE_TABLE).find(1)
+        if index < 0:
+            return None
+        return index % self.width, index // self.width
+    
+    def get_walkable_positions(self):
+        """
+        Get every walkable tile in row-major order.
+        
+        Returns:
+            list: (grid_x, grid_y) tuples of all walkable tiles
+        """
+        # One C-level pass: 0/1 flags per tile, then keep indices whose flag is set
+        flags = self.grid.translate(WALKABLE_TABLE)
+        width = self.width
+        return [(index % width, index // width) for index in compress(range(len(flags)), flags)]
     
     def pixel_to_grid(self, pixel_x, pixel_y):
         """
         Convert pixel coordinates to grid coordinates.
         
         Args:
-            pixel_x (float): Pixel x coordinate
-            pixel_y (float): Pixel y coordinate
+            pixel_x (int): Pixel x coordinate
+            pixel_y (int): Pixel y coordinate
             
         Returns:
             tuple: (grid_x, grid_y) coordinates
         """
-        return int(pixel_x // TILE_SIZE), int(pixel_y // TILE_SIZE)
+        return pixel_x // TILE_SIZE, pixel_y // TILE_SIZE
     
     def grid_to_pixel(self, grid_x, grid_y):
         """
@@ -146,6 +296,87 @@ class Map:
         """
         return grid_x * TILE_SIZE, grid_y * TILE_SIZE
     
+    def get_animation_frame(self):
+        """
+        Get the current frame of the animated water effect.
+        
+        Returns:
+            int: Water wave offset, constant for maps without water
+        """
+        if not self.has_water:
+            return 0
+        return int(time.time() * 3) % 20
+    
+    def invalidate(self, rect):
+        """
+        Redraw the tiles overlapping a region of the cached background.
+        
+        Args:
+            rect (pygame.Rect): Dirty region in world pixel coordinates
+        """
+        start_x = max(0, rect.left // TILE_SIZE)
+        start_y = max(0, rect.top // TILE_SIZE)
+        end_x = min(self.width, (rect.right - 1) // TILE_SIZE + 1)
+        end_y = min(self.height, (rect.bottom - 1) // TILE_SIZE + 1)
+        
+        grid = self.grid
+        for y in range(start_y, end_y):
+            row_start = y * self.width
+            for x in range(start_x, end_x):
+                image = self._get_tile_image(grid[row_start + x], x, y)
+                self.background.blit(image, (x * TILE_SIZE, y * TILE_SIZE))
+    
+    def _get_tile_image(self, tile_type, x, y):
+        """
+        Get the pre-rendered image for a tile, building it on first use.
+        
+        Tiles share an image when they have the same type and texture pattern,
+        so each combination is only drawn with primitives once.
+        
+        Args:
+            tile_type (int): The type of tile (from TileType class)
+            x (int): Grid x coordinate of the tile
+            y (int): Grid y coordinate of the tile
+            
+        Returns:
+            pygame.Surface: A TILE_SIZE x TILE_SIZE image of the tile
+        """
+        if tile_type == TileType.WALL:
+            variant = (x + y) % 3
+        elif tile_type in (TileType.WATER, TileType.TREE):
+            variant = 0
+        else:
+            variant = (x + y) % 4 == 0
+        
+        key = (tile_type, variant)
+        image = _tile_images.get(key)
+        if image is None:
+            image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            self._render_tile(image, Tile(tile_type, x, y), 0, 0, 0)
+            if pygame.display.get_surface() is not None:
+                image = image.convert()
+            _tile_images[key] = image
+        return image
+    
+    def _get_water_frame(self, wave_offset):
+        """
+        Get the pre-rendered water tile image for an animation frame.
+        
+        Args:
+            wave_offset (int): Water animation frame
+        
+        Returns:
+            pygame.Surface: A TILE_SIZE x TILE_SIZE image of a water tile
+        """
+        image = _water_frames.get(wave_offset)
+        if image is None:
+            image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            self._render_tile(image, Tile(TileType.WATER, 0, 0), 0, 0, wave_offset)
+            if pygame.display.get_surface() is not None:
+                image = image.convert()
+            _water_frames[wave_offset] = image
+        return image
+    
     def draw(self, screen, camera):
         """
         Draw the visible portion of the map without grid borders for cleaner appearance.
@@ -154,96 +385,49 @@ class Map:
             screen: Pygame screen surface
             camera: Camera object for viewport calculations
         """
+        # Blit the cached static background in one call
+        offset_x, offset_y = camera.get_offset()
+        screen.blit(self.background, (offset_x, offset_y))
+        
+        if not self.has_water:
+            return
+        
         # Calculate visible tile range
-        start_x = max(0, int(camera.x // TILE_SIZE))
-        start_y = max(0, int(camera.y // TILE_SIZE))
-        end_x = min(self.width, int((camera.x + camera.width) // TILE_SIZE) + 1)
-        end_y = min(self.height, int((camera.y + camera.height) // TILE_SIZE) + 1)
+        start_x = max(0, -offset_x // TILE_SIZE)
+        start_y = max(0, -offset_y // TILE_SIZE)
+        end_x = min(self.width, (camera.width - offset_x) // TILE_SIZE + 1)
+        end_y = min(self.height, (camera.height - offset_y) // TILE_SIZE + 1)
+        
+        wave_offset = self.get_animation_frame()
         
-        # Draw tiles without borders for cleaner look
+        # Animated tiles are redrawn on top of the background every frame;
+        # only rows inside the view are visited
+        image = self._get_water_frame(wave_offset)
+        water_blits = []
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile = self.tiles[y][x]
-                
-                # Calculate screen position
-                screen_x = x * TILE_SIZE - camera.x
-                screen_y = y * TILE_SIZE - camera.y
-                
-                # Draw tile without border
-                pygame.draw.rect(screen, tile.color, 
-                               (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-                
-                # Add enhanced visual details based on tile type
-                if tile.tile_type == TileType.WATER:
-                    # Animated water effect with multiple ripples
-                    wave_offset = int(time.time() * 3) % 20
-                    ripple_color = tuple(min(255, c + 20) for c in tile.color)
-                    
-                    # Draw multiple ripple lines
-                    for i in range(0, TILE_SIZE, 8):
-                        ripple_y = screen_y + (i + wave_offset) % TILE_SIZE
-                        if screen_y <= ripple_y < screen_y + TILE_SIZE:
-                            pygame.draw.line(screen, ripple_color, 
-                                           (screen_x, ripple_y), 
-                                           (screen_x + TILE_SIZE, ripple_y), 1)
-                    
-                    # Add some sparkle effects
-                    sparkle_positions = [(10, 15), (30, 35), (20, 5), (40, 25)]
-                    sparkle_color = (200, 230, 255)
-                    for sx, sy in sparkle_positions:
-                        if (wave_offset + sx + sy) % 40 < 10:
-                            pygame.draw.circle(screen, sparkle_color, 
-                                             (screen_x + sx, screen_y + sy), 1)
-                
-                elif tile.tile_type == TileType.TREE:
-                    # Enhanced tree with trunk and leaves
-                    trunk_color = (101, 67, 33)  # Brown trunk
-                    leaf_color = tuple(min(255, c + 30) for c in tile.color)
-                    
-                    # Draw trunk
-                    trunk_width = TILE_SIZE // 4
-                    trunk_x = screen_x + (TILE_SIZE - trunk_width) // 2
-                    trunk_y = screen_y + TILE_SIZE // 2
-                    pygame.draw.rect(screen, trunk_color, 
-                                   (trunk_x, trunk_y, trunk_width, TILE_SIZE // 2))
-                    
-                    # Draw leaves (multiple circles for fuller look)
-                    leaf_radius = TILE_SIZE // 3
-                    pygame.draw.circle(screen, leaf_color, 
-                                     (screen_x + TILE_SIZE // 2, screen_y + TILE_SIZE // 3), 
-                                     leaf_radius)
-                    pygame.draw.circle(screen, tile.color, 
-                                     (screen_x + TILE_SIZE // 2 - 5, screen_y + TILE_SIZE // 3 - 5), 
-                                     leaf_radius // 2)
-                    pygame.draw.circle(screen, leaf_color, 
-                                     (screen_x + TILE_SIZE // 2 + 5, screen_y + TILE_SIZE // 3 + 5), 
-                                     leaf_radius // 2)
-                
-                elif tile.tile_type == TileType.WALL:
-                    # Add subtle texture variation for visual interest without grid lines
-                    texture_color = (min(255, tile.color[0] + 10), 
-                                   min(255, tile.color[1] + 10), 
-                                   min(255, tile.color[2] + 10))
-                    
-                    # Sparse texture pattern for walls
-                    for i in range(2):
-                        for j in range(2):
-                            if (x + y + i + j) % 3 == 0:
-                                texture_x = screen_x + i * (TILE_SIZE // 2) + (TILE_SIZE // 4)
-                                texture_y = screen_y + j * (TILE_SIZE // 2) + (TILE_SIZE // 4)
-                                darker_color = (max(0, tile.color[0] - 20), 
-                                              max(0, tile.color[1] - 20), 
-                                              max(0, tile.color[2] - 20))
-                                pygame.draw.circle(screen, darker_color, (texture_x, texture_y), 2)
-                
-                # Add subtle texture variation for floor tiles without borders
-                elif tile.tile_type != TileType.WALL:
-                    # Add subtle texture dots for floor tiles
-                    texture_color = (min(255, tile.color[0] + 10), 
-                                   min(255, tile.color[1] + 10), 
-                                   min(255, tile.color[2] + 10))
-                    
-                    # Sparse texture pattern
-                    if (x + y) % 4 == 0:
-                        pygame.draw.circle(screen, texture_color, 
-                                         (screen_x + TILE_SIZE // 2, screen_y + TILE_SIZE // 2), 1)
\ No newline at end of file
+            screen_y = y * TILE_SIZE + offset_y
+            for x in self._water_rows[y]:
+                if start_x <= x < end_x:
+                    water_blits.append((image, (x * TILE_SIZE + offset_x, screen_y)))
+        
+        if water_blits:
+            screen.blits(water_blits, False)
+    
+    def _render_tile(self, surface, tile, screen_x, screen_y, wave_offset):
+        """
+        Draw a single tile with its visual details onto a surface.
+        
+        Args:
+            surface: Pygame surface to draw on
+            tile (Tile): The tile to draw
+            screen_x (float): Surface x position of the tile
+            screen_y (float): Surface y position of the tile
+            wave_offset (int): Current water animation frame
+        """
+        # Draw tile without border
+        pygame.draw.rect(surface, tile.color, 
+                       (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
+        
+        # Add enhanced visual details based on tile type
+        draw_details = _DETAIL_RENDERERS.get(tile.tile_type, _draw_floor_details)
+        draw_details(surface, tile, screen_x, screen_y, wave_offset)
\ No newline at end of file
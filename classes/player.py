@@ -22,6 +22,15 @@ class Player:
     Player class representing a controllable sprite character with smooth grid-based movement.
     """
     
+    # Fixed attribute layout: smaller instances and faster attribute access
+    __slots__ = (
+        'size', 'speed', 'color', 'game_map',
+        'grid_x', 'grid_y', 'target_grid_x', 'target_grid_y',
+        'x', 'y', 'rect', 'is_moving', 'move_progress', 'animation_speed',
+        'move_dx', 'move_dy',
+        'sprite', 'use_sprite', '_fallback_image',
+    )
+    
     def __init__(self, x, y, game_map=None):
         """
         Initialize the player with grid position and optional map reference.
@@ -36,7 +45,8 @@ class Player:
         self.color = BLUE
         self.game_map = game_map
         
-        # Convert pixel coordinates to grid coordinates
+        # Convert pixel coordinates to grid coordinates (integer math only)
+        x, y = int(x), int(y)
         if game_map:
             self.grid_x, self.grid_y = game_map.pixel_to_grid(x, y)
         else:
@@ -51,13 +61,19 @@ class Player:
         self.x = float(self.grid_x * TILE_SIZE)
         self.y = float(self.grid_y * TILE_SIZE)
         
+        # Integer pixel rectangle used for rendering, refreshed when x/y change
+        self.rect = pygame.Rect(int(self.x), int(self.y), self.size, self.size)
+        
         # Animation properties
         self.is_moving = False
         self.move_progress = 0.0
+        self.move_dx = 0  # Pixel offset from start to target tile of the current move
+        self.move_dy = 0
         self.animation_speed = 8.0  # Higher = faster animation
         
         # Load player sprite (fallback to colored rectangle if sprite fails)
         self.sprite = None
+        self._fallback_image = None  # Built on first use
         self.use_sprite = False
         try:
             # Try to load the SVG sprite (convert to surface)
@@ -166,6 +182,9 @@ class Player:
         pygame.draw.polygon(surface, (139, 0, 0), cape_points)
         pygame.draw.polygon(surface, (180, 0, 0), cape_points, 2)  # cape outline
         
+        # Match the display's pixel format so blits don't convert every frame
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
         return surface
     
     def move(self, dx, dy):
@@ -179,8 +198,8 @@ class Player:
         Returns:
             bool: True if movement was successful, False if blocked
         """
-        # Don't allow movement if already moving
-        if self.is_moving:
+        # Don't allow movement if already moving or not moving anywhere
+        if self.is_moving or (dx == 0 and dy == 0):
             return False
         
         # Calculate new target position
@@ -196,6 +215,8 @@ class Player:
         self.target_grid_y = new_grid_y
         self.is_moving = True
         self.move_progress = 0.0
+        self.move_dx = (new_grid_x - self.grid_x) * TILE_SIZE
+        self.move_dy = (new_grid_y - self.grid_y) * TILE_SIZE
         
         return True
     
@@ -211,24 +232,21 @@ class Player:
             self.move_progress += self.animation_speed * dt
             
             if self.move_progress >= 1.0:
-                # Movement complete
+                # Movement complete: snap to the target tile
                 self.move_progress = 1.0
                 self.is_moving = False
                 self.grid_x = self.target_grid_x
                 self.grid_y = self.target_grid_y
-            
-            # Interpolate position for smooth movement
-            start_x = self.grid_x * TILE_SIZE
-            start_y = self.grid_y * TILE_SIZE
-            target_x = self.target_grid_x * TILE_SIZE
-            target_y = self.target_grid_y * TILE_SIZE
-            
-            # Use easing for smoother animation
-            t = self.move_progress
-            eased_t = t * t * (3.0 - 2.0 * t)  # Smoothstep easing
-            
-            self.x = start_x + (target_x - start_x) * eased_t
-            self.y = start_y + (target_y - start_y) * eased_t
+                self.x = float(self.grid_x * TILE_SIZE)
+                self.y = float(self.grid_y * TILE_SIZE)
+            else:
+                # Interpolate from the start tile using the offset fixed in move()
+                t = self.move_progress
+                eased_t = t * t * (3.0 - 2.0 * t)  # Smoothstep easing
+                
+                self.x = self.grid_x * TILE_SIZE + self.move_dx * eased_t
+                self.y = self.grid_y * TILE_SIZE + self.move_dy * eased_t
+            self.rect.topleft = (int(self.x), int(self.y))
     
     def set_map(self, game_map):
         """
@@ -239,6 +257,22 @@ class Player:
         """
         self.game_map = game_map
     
+    def set_grid_position(self, grid_x, grid_y):
+        """
+        Place the player directly on a grid position, cancelling any movement.
+        
+        Args:
+            grid_x (int): Grid x coordinate
+            grid_y (int): Grid y coordinate
+        """
+        self.grid_x = self.target_grid_x = grid_x
+        self.grid_y = self.target_grid_y = grid_y
+        self.x = float(grid_x * TILE_SIZE)
+        self.y = float(grid_y * TILE_SIZE)
+        self.rect.topleft = (int(self.x), int(self.y))
+        self.is_moving = False
+        self.move_progress = 0.0
+    
     def get_grid_position(self):
         """
         Get the player's current logical grid position.
@@ -258,14 +292,29 @@ class Player:
         """
         # Calculate screen position
         if camera:
-            screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+            rect = self.rect.move(camera.get_offset())
         else:
-            screen_x, screen_y = self.x, self.y
+            rect = self.rect
         
         if self.use_sprite and self.sprite:
             # Draw the sprite
-            screen.blit(self.sprite, (int(screen_x), int(screen_y)))
+            screen.blit(self.sprite, rect)
         else:
             # Fallback to colored rectangle with border for better visibility
-            pygame.draw.rect(screen, self.color, (int(screen_x), int(screen_y), self.size, self.size))
-            pygame.draw.rect(screen, WHITE, (int(screen_x), int(screen_y), self.size, self.size), 2)
\ No newline at end of file
+            if self._fallback_image is None:
+                self._fallback_image = self._create_fallback_surface()
+            screen.blit(self._fallback_image, rect)
+    
+    def _create_fallback_surface(self):
+        """
+        Create the colored rectangle drawn when the sprite is unavailable.
+        
+        Returns:
+            pygame.Surface: The fallback surface
+        """
+        surface = pygame.Surface((self.size, self.size))
+        surface.fill(self.color)
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 2)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
\ No newline at end of file
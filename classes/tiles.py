@@ -77,8 +77,30 @@ class TileType:
     @classmethod
     def from_char(cls, char):
         """Convert a character to a tile type."""
+        if len(char) != 1:
+            return cls.EMPTY
+        code = ord(char)
+        if code < 256:
+            return CHAR_TYPE_TABLE[code]
+        # A few non-Latin-1 letters upper-case to ASCII, e.g. dotless i
         return cls.CHAR_TO_TYPE.get(char.upper(), cls.EMPTY)
 
+def _build_char_type_table():
+    """
+    Build the 256-byte lookup table from character code to tile type.
+    
+    Returns:
+        bytes: Tile type for every character code, in either case; unmapped
+            characters are EMPTY
+    """
+    table = bytearray([TileType.EMPTY]) * 256
+    for char, tile_type in TileType.CHAR_TO_TYPE.items():
+        table[ord(char)] = table[ord(char.lower())] = tile_type
+    return bytes(table)
+
+# Character code -> tile type, used by from_char() and with bytes.translate()
+CHAR_TYPE_TABLE = _build_char_type_table()
+
 # Tile colors - Enhanced for better visual variety
 TILE_COLORS = {
     TileType.EMPTY: (45, 45, 50),      # Dark blue-gray for indoor floors
@@ -146,6 +168,39 @@ TILE_ACCENT_COLORS = {
 # Walkable tile types (tiles the player can move onto)
 WALKABLE_TILES = {TileType.EMPTY, TileType.GRASS, TileType.PATHWAY, TileType.LIBRARY, TileType.CAFETERIA, TileType.DORMITORY, TileType.SPORTS_FIELD, TileType.PARKING_LOT, TileType.DOOR, TileType.DESK, TileType.CHAIR, TileType.DINING_TABLE, TileType.SERVING_COUNTER, TileType.BED, TileType.BATHROOM, TileType.PARKING_SPACE, TileType.DRIVING_LANE, TileType.SIDEWALK, TileType.LIBRARY_DOOR, TileType.CAFETERIA_DOOR, TileType.DORMITORY_DOOR, TileType.PARKING_DOOR}
 
+# Dense per-type tables indexed by tile type value (0-255, matching Map.grid)
+TILE_COLOR_TABLE = tuple(TILE_COLORS.get(code, (255, 0, 255)) for code in range(256))  # Magenta for unknown types
+WALKABLE_TABLE = bytes(code in WALKABLE_TILES for code in range(256))
+
+# Pre-rendered tile surfaces keyed by tile type, built on first use
+_tile_surfaces = {}
+
+def get_tile_surface(tile_type):
+    """
+    Get the cached surface for a tile type with its accent border baked in.
+    
+    Args:
+        tile_type (int): The type of tile (from TileType class)
+        
+    Returns:
+        pygame.Surface: A TILE_SIZE x TILE_SIZE surface for the tile type
+    """
+    surface = _tile_surfaces.get(tile_type)
+    if surface is None:
+        color = TILE_COLOR_TABLE[tile_type]
+        surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        surface.fill(color)
+        
+        # Add accent/border for visual variety
+        accent_color = TILE_ACCENT_COLORS.get(tile_type, color)
+        if accent_color != color:
+            pygame.draw.rect(surface, accent_color, (2, 2, TILE_SIZE - 4, TILE_SIZE - 4), 2)
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        _tile_surfaces[tile_type] = surface
+    return surface
+
 class Tile:
     """
     Tile class representing individual map tiles.
@@ -165,8 +220,9 @@ class Tile:
         self.grid_y = y
         self.pixel_x = x * TILE_SIZE
         self.pixel_y = y * TILE_SIZE
-        self.walkable = tile_type in WALKABLE_TILES
-        self.color = TILE_COLORS.get(tile_type, (255, 0, 255))  # Magenta for unknown types
+        self.rect = pygame.Rect(self.pixel_x, self.pixel_y, TILE_SIZE, TILE_SIZE)
+        self.walkable = bool(WALKABLE_TABLE[tile_type])
+        self.color = TILE_COLOR_TABLE[tile_type]
     
     def draw(self, screen, camera_x=0, camera_y=0):
         """
@@ -177,17 +233,8 @@ class Tile:
             camera_x (int): Camera x offset
             camera_y (int): Camera y offset
         """
-        # Calculate screen position with camera offset
-        screen_x = self.pixel_x - camera_x
-        screen_y = self.pixel_y - camera_y
-        
-        # Draw main tile
-        pygame.draw.rect(screen, self.color, (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
-        
-        # Add accent/border for visual variety
-        accent_color = TILE_ACCENT_COLORS.get(self.tile_type, self.color)
-        if accent_color != self.color:
-            pygame.draw.rect(screen, accent_color, (screen_x + 2, screen_y + 2, TILE_SIZE - 4, TILE_SIZE - 4), 2)
+        # Blit the pre-rendered tile (accent border included) with camera offset
+        screen.blit(get_tile_surface(self.tile_type), self.rect.move(-camera_x, -camera_y))
     
     def get_rect(self):
         """
@@ -196,7 +243,7 @@ class Tile:
         Returns:
             pygame.Rect: Rectangle representing the tile's position and size
         """
-        return pygame.Rect(self.pixel_x, self.pixel_y, TILE_SIZE, TILE_SIZE)
+        return self.rect
     
     def is_walkable(self):
         """
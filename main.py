@@ -2,20 +2,21 @@ import pygame
 import sys
 from classes.game import Game
 
-# Initialize Pygame
-pygame.init()
-
 def main():
     """
     Main function to start the game.
     """
+    # Initialize Pygame here rather than at import time
+    pygame.init()
     try:
         game = Game()
         game.run()
     except Exception as e:
         print(f"An error occurred: {e}")
+        return 1
+    finally:
         pygame.quit()
-        sys.exit(1)
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file